@@ -4,4 +4,15 @@ from .logger import logger
 from .exceptions import *
 from .objects import RetrySettings, ReconnectionSettings
 
+from google.protobuf.internal import api_implementation as _pb_implementation
+
+def _warn_if_pure_python_protobuf():
+    if _pb_implementation.Type() == "python":
+        logger.warning(
+            "protobuf is using its pure-Python implementation: message parsing and serialization will be much slower. "
+            "Install a protobuf wheel that ships the upb backend for your platform."
+        )
+
+_warn_if_pure_python_protobuf()
+
 __version__ = '1.5.9'
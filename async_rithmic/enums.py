@@ -3,12 +3,17 @@ import enum
 from . import protocol_buffers as pb
 
 
-class DataType(enum.IntEnum):
+class DataType(enum.IntFlag):
     LAST_TRADE = 1
     BBO = 2
     ORDER_BOOK = 4
 
 
+# Single-bit lookup (e.g. DataType.from_bit(1) -> DataType.LAST_TRADE), avoids going through EnumMeta.__call__
+_DATATYPE_BY_VALUE = {m.value: m for m in DataType}
+DataType.from_bit = staticmethod(_DATATYPE_BY_VALUE.get)
+
+
 OrderType = pb.request_new_order_pb2.RequestNewOrder.PriceType
 OrderDuration = pb.request_new_order_pb2.RequestNewOrder.Duration
 TransactionType = pb.request_new_order_pb2.RequestNewOrder.TransactionType
@@ -6,3 +6,8 @@ class RithmicErrorResponse(Exception):
 class InvalidRequestError(Exception):
     """Raised when a user-level API call is missing required arguments or is malformed."""
     pass
+
+
+class ReconnectionError(RuntimeError):
+    """Raised when a plant gives up reconnecting after its WebSocket connection was closed."""
+    pass
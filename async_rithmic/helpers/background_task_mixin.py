@@ -1,7 +1,9 @@
 import asyncio
+import logging
 from google.protobuf.json_format import MessageToDict
 
 from .connectivity import DisconnectionHandler
+from ..exceptions import ReconnectionError
 from .concurrency import try_acquire_lock
 
 class BackgroundTaskMixin:
@@ -17,11 +19,16 @@ class BackgroundTaskMixin:
     def __init__(self, **kwargs):
         self._inbound_queue = asyncio.Queue()
         self._bg_tasks: list[asyncio.Task] = []
+        # Set once reconnection attempts are exhausted, until background tasks are restarted
+        self._connection_lost = False
 
     async def _start_background_tasks(self):
         """
         Starts background tasks and stores their references for graceful shutdown.
         """
+        self._connection_lost = False
+        self._bg_tasks = [task for task in self._bg_tasks if not task.done()]
+
         self._bg_tasks.append(asyncio.create_task(self._recv_loop(), name="recv_loop"))
         self._bg_tasks.append(asyncio.create_task(self._process_loop(), name="process_loop"))
         self._bg_tasks.append(asyncio.create_task(self._heartbeat_loop(), name="heartbeat_loop"))
@@ -30,22 +37,40 @@ class BackgroundTaskMixin:
 
     async def _stop_background_tasks(self):
         """
-        Cancels and awaits all background tasks.
+        Cancels and awaits all background tasks, then any listener tasks still running.
         """
-        if not self._bg_tasks:
-            return
+        if self._bg_tasks:
+            for task in self._bg_tasks:
+                task.cancel()
 
-        for task in self._bg_tasks:
-            task.cancel()
+            results = await asyncio.gather(*self._bg_tasks, return_exceptions=True)
+
+            for task, result in zip(self._bg_tasks, results):
+                if isinstance(result, Exception) and not isinstance(result, asyncio.CancelledError):
+                    self.logger.warning(f"Background task {task.get_name()} failed: {result}")
 
-        results = await asyncio.gather(*self._bg_tasks, return_exceptions=True)
+            self._bg_tasks.clear()
+            self.logger.debug("Background tasks stopped")
 
-        for task, result in zip(self._bg_tasks, results):
-            if isinstance(result, Exception) and not isinstance(result, asyncio.CancelledError):
-                self.logger.warning(f"Background task {task.get_name()} failed: {result}")
+        await self._stop_callback_tasks()
+
+    async def _on_connection_lost(self):
+        """
+        Called when reconnection attempts are exhausted.
+        Stops the other background tasks so that e.g. a later heartbeat can't log the plant back in
+        without a recv loop, and notifies listeners through `on_disconnected`.
+        """
+        if self._connection_lost:
+            return
 
-        self._bg_tasks.clear()
-        self.logger.debug("Background tasks stopped")
+        self._connection_lost = True
+
+        current_task = asyncio.current_task()
+        for task in self._bg_tasks:
+            if task is not current_task:
+                task.cancel()
+
+        await self.client.on_disconnected.call_async(self.plant_type)
 
     async def _recv_loop(self):
         """
@@ -72,7 +97,13 @@ class BackgroundTaskMixin:
             except asyncio.CancelledError:
                 break
 
-            except:
+            except ReconnectionError:
+                # Reconnection attempts are exhausted: stop instead of re-entering the loop on a dead socket
+                self.logger.error("Stopping background tasks: the connection could not be re-established")
+                await self._on_connection_lost()
+                break
+
+            except Exception:
                 self.logger.exception("Exception in background listener")
 
     async def _process_loop(self):
@@ -83,7 +114,8 @@ class BackgroundTaskMixin:
             buffer = await self._inbound_queue.get()
             try:
                 response = self._convert_bytes_to_response(buffer)
-                self.logger.debug(f"Received message {MessageToDict(response)}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Received message {MessageToDict(response)}")
 
                 await self._process_response(response)
 
@@ -105,6 +137,11 @@ class BackgroundTaskMixin:
             except asyncio.CancelledError:
                 break
 
+            except ReconnectionError:
+                self.logger.error("Stopping background tasks: the connection could not be re-established")
+                await self._on_connection_lost()
+                break
+
             except Exception as e:
                 self.logger.warning("Heartbeat failed", exc_info=e)
 
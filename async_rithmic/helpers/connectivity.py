@@ -2,6 +2,8 @@ import asyncio
 from contextlib import asynccontextmanager
 from websockets.exceptions import ConnectionClosedError, ConnectionClosedOK
 
+from ..exceptions import ReconnectionError
+
 @asynccontextmanager
 async def DisconnectionHandler(plant):
     """
@@ -15,13 +17,19 @@ async def DisconnectionHandler(plant):
 
         if not await try_to_reconnect(plant):
             plant.logger.error("Failed to reconnect - giving up")
-            raise RuntimeError("Unable to reconnect WebSocket") from e
+            raise ReconnectionError("Unable to reconnect WebSocket") from e
 
 async def try_to_reconnect(plant, attempt=1):
     """
     A wrapper around the reconnection logic that ensures no simultaneous reconnection attempts.
     """
 
+    if plant._connection_lost:
+        # A previous reconnection round gave up and the background tasks were stopped:
+        # the plant must be reconnected through the client
+        plant.logger.error("Connection was lost - not reconnecting until the client reconnects")
+        return False
+
     async with plant._reconnect_lock:
         if not plant._reconnect_event.is_set():
             plant.logger.info("Reconnection already in progress, waiting...")
@@ -13,6 +13,9 @@ class RequestManager:
         self.requests = {}
         self.responses = defaultdict(list)
         self.expected_responses = {}
+        # template_id -> {request_id: expected_response}, so incoming responses are only
+        # matched against the requests that are waiting for their template
+        self.expected_by_template = defaultdict(dict)
         self.done_events = {}
         self.start_times = {}
 
@@ -21,6 +24,7 @@ class RequestManager:
         self.responses[request_id] = []
         self.done_events[request_id] = asyncio.Event()
         self.expected_responses[request_id] = expected_response
+        self.expected_by_template[expected_response.get("template_id")][request_id] = expected_response
         self.start_times[request_id] = time.time()
 
     async def send_and_collect(self, timeout: float = 30.0, **kwargs):
@@ -51,7 +55,7 @@ class RequestManager:
         except asyncio.TimeoutError:
             self.plant.logger.exception(f"Timeout waiting for complete response stream for request_id={request_id}")
             self.done_events.pop(request_id, None)
-            self.expected_responses.pop(request_id, None)
+            self._forget_expected_response(request_id)
             raise
 
         finally:
@@ -64,7 +68,11 @@ class RequestManager:
         Accumulate responses until the response stream is marked as complete
         """
 
-        for request_id, expected_response in self.expected_responses.items():
+        candidates = self.expected_by_template.get(response.template_id)
+        if not candidates:
+            return None
+
+        for request_id, expected_response in candidates.items():
             if not all(getattr(response, k) == v for k, v in expected_response.items()):
                 continue
 
@@ -90,10 +98,22 @@ class RequestManager:
 
             # Clean up
             self.done_events.pop(request_id, None)
-            self.expected_responses.pop(request_id, None)
+            self._forget_expected_response(request_id)
             self.start_times.pop(request_id, None)
         else:
             self.plant.logger.error(f"Unknown request {request_id}")
 
+    def _forget_expected_response(self, request_id: str):
+        expected_response = self.expected_responses.pop(request_id, None)
+        if expected_response is None:
+            return
+
+        template_id = expected_response.get("template_id")
+        candidates = self.expected_by_template.get(template_id)
+        if candidates is not None:
+            candidates.pop(request_id, None)
+            if not candidates:
+                del self.expected_by_template[template_id]
+
     def has_pending(self, request_id: str):
         return request_id in self.responses
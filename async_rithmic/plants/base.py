@@ -3,6 +3,9 @@ from websockets import ConnectionClosedError, ConnectionClosedOK
 from websockets.protocol import OPEN
 from collections import defaultdict
 import asyncio
+import functools
+import logging
+import struct
 import uuid
 import random
 from datetime import datetime
@@ -14,7 +17,7 @@ from google.protobuf.json_format import MessageToDict
 from .. import protocol_buffers as pb
 from ..logger import logger
 from ..enums import SysInfraType
-from ..exceptions import RithmicErrorResponse
+from ..exceptions import RithmicErrorResponse, ReconnectionError
 from ..helpers.request_manager import RequestManager
 from ..helpers.connectivity import DisconnectionHandler, try_to_reconnect
 from ..helpers.concurrency import try_acquire_lock
@@ -128,6 +131,42 @@ TEMPLATES_MAP = {
     451: pb.account_pnl_position_update_pb2.AccountPnLPositionUpdate,
 }
 
+# Every message on the wire is prefixed by its length as a 4-byte big-endian signed int
+LENGTH_PREFIX = struct.Struct(">i")
+
+PLANT_TYPES = {
+    SysInfraType.HISTORY_PLANT: "history",
+    SysInfraType.PNL_PLANT: "pnl",
+    SysInfraType.TICKER_PLANT: "ticker",
+    SysInfraType.ORDER_PLANT: "order",
+}
+
+FIELD_SCALAR, FIELD_REPEATED, FIELD_MESSAGE = range(3)
+
+@functools.cache
+def _get_field_kind(message_cls, field_name):
+    """
+    Resolves how a protobuf field must be assigned.
+    Cached per (message class, field name) so the descriptor is only walked once.
+    """
+    field_descriptor = message_cls.DESCRIPTOR.fields_by_name[field_name]
+
+    if field_descriptor.label == FieldDescriptor.LABEL_REPEATED:
+        return FIELD_REPEATED
+    elif field_descriptor.type == FieldDescriptor.TYPE_MESSAGE:
+        return FIELD_MESSAGE
+    return FIELD_SCALAR
+
+ACCOUNT_FIELDS = ("fcm_id", "ib_id", "user_type")
+
+@functools.cache
+def _get_account_fields(message_cls):
+    """
+    Returns the login info fields (fcm_id, ib_id, user_type) defined by a request class.
+    """
+    fields_by_name = message_cls.DESCRIPTOR.fields_by_name
+    return tuple(f for f in ACCOUNT_FIELDS if f in fields_by_name)
+
 class BasePlant(BackgroundTaskMixin):
     infra_type = None
 
@@ -139,10 +178,20 @@ class BasePlant(BackgroundTaskMixin):
         self.lock = asyncio.Lock()
         self.request_manager = RequestManager(self)
 
+        # Reused to peek at the template_id of every inbound message (ParseFromString clears it first)
+        self._base_message = pb.base_pb2.Base()
+
         # Heartbeats have to be sent every {interval} seconds, unless an update was received
         self.heartbeat_interval = 30
         self.listen_interval = kwargs.pop("listen_interval", 0.1)
 
+        # "sync": real-time listeners are awaited in order before the next inbound message is processed
+        # "task": each dispatch runs in its own task, so a slow listener doesn't delay the processing of later messages
+        self.callback_mode = kwargs.pop("callback_mode", "sync")
+        if self.callback_mode not in ("sync", "task"):
+            raise ValueError(f"Unknown callback_mode: {self.callback_mode}")
+        self._callback_tasks = set()
+
         # Initialize logger
         logger_name = f"plant.{self.plant_type}"
         if "logger_name_suffix" in kwargs:
@@ -171,12 +220,7 @@ class BasePlant(BackgroundTaskMixin):
 
     @property
     def plant_type(self):
-        return {
-            SysInfraType.HISTORY_PLANT: "history",
-            SysInfraType.PNL_PLANT: "pnl",
-            SysInfraType.TICKER_PLANT: "ticker",
-            SysInfraType.ORDER_PLANT: "order",
-        }[self.infra_type]
+        return PLANT_TYPES[self.infra_type]
 
     async def _connect(self):
         """
@@ -272,7 +316,7 @@ class BasePlant(BackgroundTaskMixin):
 
             if not await try_to_reconnect(self):
                 self.logger.error("Failed to reconnect - giving up")
-                raise RuntimeError("Unable to reconnect WebSocket") from e
+                raise ReconnectionError("Unable to reconnect WebSocket") from e
 
             self.logger.info("Retrying send after successful reconnect")
 
@@ -287,7 +331,8 @@ class BasePlant(BackgroundTaskMixin):
         Create Request class instance, convert it to bytes and send it to the server
         """
         request = self._build_request(**kwargs)
-        self.logger.debug(f"Sending message {MessageToDict(request)}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Sending message {MessageToDict(request)}")
 
         template_id = kwargs["template_id"]
         buffer = self._convert_request_to_bytes(request)
@@ -305,12 +350,8 @@ class BasePlant(BackgroundTaskMixin):
         for k, v in kwargs.items():
             self._set_pb_field(request, k, v)
 
-        if request.DESCRIPTOR.fields_by_name.get("fcm_id"):
-            request.fcm_id = self.client.fcm_id
-        if request.DESCRIPTOR.fields_by_name.get("ib_id"):
-            request.ib_id = self.client.ib_id
-        if request.DESCRIPTOR.fields_by_name.get("user_type"):
-            request.user_type = self.client.user_type
+        for field_name in _get_account_fields(type(request)):
+            setattr(request, field_name, getattr(self.client, field_name))
 
         return request
 
@@ -329,7 +370,8 @@ class BasePlant(BackgroundTaskMixin):
         async with try_acquire_lock(self, context=f"send_and_recv_immediate_{kwargs.get('template_id')}"):
 
             request = self._build_request(**kwargs)
-            self.logger.debug(f"Sending message {MessageToDict(request)}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Sending message {MessageToDict(request)}")
 
             buffer = self._convert_request_to_bytes(request)
             await self.ws.send(buffer)
@@ -338,7 +380,8 @@ class BasePlant(BackgroundTaskMixin):
                 buffer = await self.ws.recv()
 
                 response = self._convert_bytes_to_response(buffer)
-                self.logger.debug(f"Received message {MessageToDict(response)}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Received message {MessageToDict(response)}")
 
                 if response.template_id != kwargs["template_id"] + 1:
                     await self._process_response(response)
@@ -373,7 +416,8 @@ class BasePlant(BackgroundTaskMixin):
                     buffer = await self._recv()
 
                 response = self._convert_bytes_to_response(buffer)
-                self.logger.debug(f"Received message {MessageToDict(response)}")
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Received message {MessageToDict(response)}")
 
                 if not hasattr(response, "rp_code") or response.template_id != template_id + 1:
                     await self._process_response(response)
@@ -442,10 +486,7 @@ class BasePlant(BackgroundTaskMixin):
         Request class to bytes conversion
         """
         serialized = request.SerializeToString()
-        length = len(serialized)
-        buffer = length.to_bytes(4, byteorder='big', signed=True)
-        buffer += serialized
-        return buffer
+        return LENGTH_PREFIX.pack(len(serialized)) + serialized
 
     def _convert_bytes_to_response(self, buffer):
         """
@@ -454,31 +495,30 @@ class BasePlant(BackgroundTaskMixin):
         raw_data = buffer[4:]
 
         # Parse as base to extract template_id
-        base = pb.base_pb2.Base()
-        base.ParseFromString(raw_data)
+        self._base_message.ParseFromString(raw_data)
 
-        template_id = base.template_id
-        if template_id not in TEMPLATES_MAP:
+        template_id = self._base_message.template_id
+        response_cls = TEMPLATES_MAP.get(template_id)
+        if response_cls is None:
             raise Exception(f"Unknown template ID: {template_id}")
 
         # Parse as specific response class
-        response_cls = TEMPLATES_MAP[template_id]
         response = response_cls()
         response.ParseFromString(raw_data)
 
         return response
 
     def _set_pb_field(self, obj, field_name, value):
-        field_descriptor = obj.DESCRIPTOR.fields_by_name[field_name]
+        field_kind = _get_field_kind(type(obj), field_name)
 
-        if field_descriptor.label == FieldDescriptor.LABEL_REPEATED:
+        if field_kind == FIELD_REPEATED:
             # Handle repeated fields (lists in protobuf)
             field = getattr(obj, field_name)
             if isinstance(value, list):
                 field.extend(value)
             else:
                 field.append(value)
-        elif field_descriptor.type == FieldDescriptor.TYPE_MESSAGE:
+        elif field_kind == FIELD_MESSAGE:
             # Handle nested message fields
             nested_message = getattr(obj, field_name)
             for sub_key, sub_value in value.items():
@@ -491,6 +531,37 @@ class BasePlant(BackgroundTaskMixin):
                 self.logger.error(f"Error when trying to set {field_name}")
                 raise
 
+    async def _dispatch(self, event, *args):
+        """
+        Forwards a real-time update to the client's event listeners, according to `callback_mode`
+        """
+        if self.callback_mode == "task":
+            task = asyncio.create_task(event.call_async(*args))
+            # Keep a strong reference until the task is done
+            self._callback_tasks.add(task)
+            task.add_done_callback(self._on_callback_task_done)
+        else:
+            await event.call_async(*args)
+
+    def _on_callback_task_done(self, task):
+        self._callback_tasks.discard(task)
+
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.error("Exception in event listener", exc_info=task.exception())
+
+    async def _stop_callback_tasks(self):
+        """
+        Cancels and awaits the listener tasks started in `callback_mode="task"`
+        """
+        if not self._callback_tasks:
+            return
+
+        tasks = list(self._callback_tasks)
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
     async def _send_heartbeat(self):
         await self._send_request(template_id=18)
 
@@ -1,19 +1,25 @@
 from datetime import datetime
 import asyncio
-from collections import defaultdict
 
 from .base import BasePlant
 from ..enums import SysInfraType, TimeBarType
 from .. import protocol_buffers as pb
 
+TickBarType = pb.request_tick_bar_replay_pb2.RequestTickBarReplay.BarType
+TickBarSubType = pb.request_tick_bar_replay_pb2.RequestTickBarReplay.BarSubType
+TickBarTimeOrder = pb.request_tick_bar_replay_pb2.RequestTickBarReplay.TimeOrder
+TimeBarTimeOrder = pb.request_time_bar_replay_pb2.RequestTimeBarReplay.TimeOrder
+TimeBarUpdateRequest = pb.request_time_bar_update_pb2.RequestTimeBarUpdate.Request
+
 class HistoryPlant(BasePlant):
     infra_type = SysInfraType.HISTORY_PLANT
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.historical_tick_data = defaultdict(list)
-        self.historical_time_bar_data = defaultdict(list)
+        # Buffers keyed by request, only populated while a `wait=True` call is collecting that key
+        self.historical_tick_data = {}
+        self.historical_time_bar_data = {}
 
         self.historical_tick_event = asyncio.Event()
         self.historical_time_bar_event = asyncio.Event()
@@ -33,11 +39,13 @@ class HistoryPlant(BasePlant):
 
     async def _on_historical_time_bar(self, data):
         key = f"{data['symbol']}_{data['type']}"
-        self.historical_time_bar_data[key].append(data)
+        if key in self.historical_time_bar_data:
+            self.historical_time_bar_data[key].append(data)
 
     async def _on_historical_tick(self, data):
         key = f"{data['symbol']}"
-        self.historical_tick_data[key].append(data)
+        if key in self.historical_tick_data:
+            self.historical_tick_data[key].append(data)
 
     async def get_historical_tick_data(
         self,
@@ -57,37 +65,42 @@ class HistoryPlant(BasePlant):
         :param end_time: (dt) end time as datetime in utc
         """
 
+        key = f"{symbol}"
         if wait:
             self.historical_tick_event = asyncio.Event()
-
-        await self._send_and_recv_immediate(
-            template_id=206,
-            user_msg=symbol,
-            symbol=symbol,
-            exchange=exchange,
-            bar_type=pb.request_tick_bar_replay_pb2.RequestTickBarReplay.BarType.TICK_BAR,
-            bar_type_specifier="1",
-            bar_sub_type=pb.request_tick_bar_replay_pb2.RequestTickBarReplay.BarSubType.REGULAR,
-            time_order=pb.request_tick_bar_replay_pb2.RequestTickBarReplay.TimeOrder.FORWARDS,
-            start_index=self._datetime_to_index(start_time),
-            finish_index=self._datetime_to_index(end_time),
-        )
-
-        # Wait until all the historical data has been fetched before returning it
-        if wait:
-            key = f"{symbol}"
-
-            try:
-                await asyncio.wait_for(self.historical_tick_event.wait(), 5.0)
-            except asyncio.TimeoutError:
-                if len(self.historical_tick_data[key]) == 0:
-                    # No data returned by Rithmic for the request
-                    return []
-
-            await self.historical_tick_event.wait()
-
-            data = self.historical_tick_data.pop(key)
-            return data
+            self.historical_tick_data.setdefault(key, [])
+
+        # The buffer is only kept while this request waits for it, whatever the outcome
+        try:
+            await self._send_and_recv_immediate(
+                template_id=206,
+                user_msg=symbol,
+                symbol=symbol,
+                exchange=exchange,
+                bar_type=TickBarType.TICK_BAR,
+                bar_type_specifier="1",
+                bar_sub_type=TickBarSubType.REGULAR,
+                time_order=TickBarTimeOrder.FORWARDS,
+                start_index=self._datetime_to_index(start_time),
+                finish_index=self._datetime_to_index(end_time),
+            )
+
+            # Wait until all the historical data has been fetched before returning it
+            if wait:
+                try:
+                    await asyncio.wait_for(self.historical_tick_event.wait(), 5.0)
+                except asyncio.TimeoutError:
+                    if len(self.historical_tick_data[key]) == 0:
+                        # No data returned by Rithmic for the request
+                        return []
+
+                await self.historical_tick_event.wait()
+
+                return self.historical_tick_data[key]
+
+        finally:
+            if wait:
+                self.historical_tick_data.pop(key, None)
 
     async def get_historical_time_bars(
         self,
@@ -99,35 +112,40 @@ class HistoryPlant(BasePlant):
         bar_type_periods: int,
         wait: bool = True
     ):
+        key = f"{symbol}_{bar_type}"
         if wait:
             self.historical_time_bar_event = asyncio.Event()
-
-        await self._send_and_recv_immediate(
-            template_id=202,
-            symbol=symbol,
-            exchange=exchange,
-            bar_type=bar_type,
-            bar_type_period=bar_type_periods,
-            time_order=pb.request_time_bar_replay_pb2.RequestTimeBarReplay.TimeOrder.FORWARDS,
-            start_index=self._datetime_to_index(start_time),
-            finish_index=self._datetime_to_index(end_time),
-        )
-
-        # Wait until all the historical data has been fetched before returning it
-        if wait:
-            key = f"{symbol}_{bar_type}"
-
-            try:
-                await asyncio.wait_for(self.historical_time_bar_event.wait(), 5.0)
-            except asyncio.TimeoutError:
-                if len(self.historical_time_bar_data[key]) == 0:
-                    # No data returned by Rithmic for the request
-                    return []
-
-            await self.historical_time_bar_event.wait()
-
-            data = self.historical_time_bar_data.pop(key)
-            return data
+            self.historical_time_bar_data.setdefault(key, [])
+
+        # The buffer is only kept while this request waits for it, whatever the outcome
+        try:
+            await self._send_and_recv_immediate(
+                template_id=202,
+                symbol=symbol,
+                exchange=exchange,
+                bar_type=bar_type,
+                bar_type_period=bar_type_periods,
+                time_order=TimeBarTimeOrder.FORWARDS,
+                start_index=self._datetime_to_index(start_time),
+                finish_index=self._datetime_to_index(end_time),
+            )
+
+            # Wait until all the historical data has been fetched before returning it
+            if wait:
+                try:
+                    await asyncio.wait_for(self.historical_time_bar_event.wait(), 5.0)
+                except asyncio.TimeoutError:
+                    if len(self.historical_time_bar_data[key]) == 0:
+                        # No data returned by Rithmic for the request
+                        return []
+
+                await self.historical_time_bar_event.wait()
+
+                return self.historical_time_bar_data[key]
+
+        finally:
+            if wait:
+                self.historical_time_bar_data.pop(key, None)
 
     async def subscribe_to_time_bar_data(
         self,
@@ -147,7 +165,7 @@ class HistoryPlant(BasePlant):
             template_id=200,
             symbol=symbol,
             exchange=exchange,
-            request=pb.request_time_bar_update_pb2.RequestTimeBarUpdate.Request.SUBSCRIBE,
+            request=TimeBarUpdateRequest.SUBSCRIBE,
             bar_type=bar_type,
             bar_type_period=bar_type_periods,
         )
@@ -166,7 +184,7 @@ class HistoryPlant(BasePlant):
             template_id=200,
             symbol=symbol,
             exchange=exchange,
-            request=pb.request_time_bar_update_pb2.RequestTimeBarUpdate.Request.UNSUBSCRIBE,
+            request=TimeBarUpdateRequest.UNSUBSCRIBE,
             bar_type=bar_type,
             bar_type_period=bar_type_periods,
         )
@@ -204,7 +222,7 @@ class HistoryPlant(BasePlant):
             data = self._response_to_dict(response)
             data["bar_end_datetime"] = datetime.fromtimestamp(data['marker'])
 
-            await self.client.on_time_bar.call_async(data)
+            await self._dispatch(self.client.on_time_bar, data)
 
         else:
             self.logger.warning(f"Unhandled inbound message with template_id={response.template_id}")
@@ -12,7 +12,31 @@ class OrderPlant(BasePlant):
 
     login_info = None
     trade_routes = None
-    accounts = None
+
+    def __init__(self, client, **kwargs):
+        super().__init__(client, **kwargs)
+
+        # Resolve the client event of each inbound update once, instead of walking an if/elif chain per message
+        self._update_events = {
+            350: client.on_trade_route_update,  # Trade route update
+            351: client.on_rithmic_order_notification,  # Rithmic order notification
+            352: client.on_exchange_order_notification,  # Exchange order notification
+            353: client.on_bracket_update,  # Bracket update
+        }
+
+        # Lookup tables built once at login, used on every order submission
+        self._trade_route_by_exchange = {}
+        self.accounts = None
+
+    @property
+    def accounts(self):
+        return self._accounts
+
+    @accounts.setter
+    def accounts(self, accounts):
+        # Keep the set of valid account ids in sync with the account list
+        self._accounts = accounts
+        self._account_ids = {a.account_id for a in accounts} if accounts is not None else set()
 
     async def _login(self):
         await super()._login()
@@ -40,6 +64,12 @@ class OrderPlant(BasePlant):
         # Note: when reconnecting, we can't call `_send_and_collect` b/c the background recv task might be blocked
         if self.trade_routes is None:
             self.trade_routes = await self._list_trade_routes()
+
+            # Keep the first route listed for each exchange
+            self._trade_route_by_exchange = {}
+            for route in self.trade_routes:
+                self._trade_route_by_exchange.setdefault(route.exchange, route.trade_route)
+
         if self.accounts is None:
             self.accounts = await self.list_accounts()
 
@@ -146,9 +176,18 @@ class OrderPlant(BasePlant):
         else:
             account_ids = [a.account_id for a in self.accounts]
 
-        # Fetch order from each sub account
-        for account_id in account_ids:
-            orders = await self.list_orders(account_id=account_id)
+        # Fetch orders from all sub accounts concurrently
+        # A failing account only matters if the order isn't found in any of the other ones
+        orders_by_account = await asyncio.gather(*[
+            self.list_orders(account_id=account_id)
+            for account_id in account_ids
+        ], return_exceptions=True)
+
+        first_exception = None
+        for orders in orders_by_account:
+            if isinstance(orders, BaseException):
+                first_exception = first_exception or orders
+                continue
 
             if order_id:
                 orders = [o for o in orders if o.user_tag == order_id]
@@ -158,6 +197,9 @@ class OrderPlant(BasePlant):
             if orders:
                 return orders[0]
 
+        if first_exception is not None:
+            raise first_exception
+
         return None
 
     def _get_account_id(self, **kwargs):
@@ -171,13 +213,11 @@ class OrderPlant(BasePlant):
         elif "account_id" not in kwargs:
             raise InvalidRequestError(f"Missing argument: account_id (possible values are: {','.join([a.account_id for a in self.accounts])})")
 
+        elif kwargs["account_id"] not in self._account_ids:
+            raise InvalidRequestError(f"Invalid account_id specified (possible values are: {','.join([a.account_id for a in self.accounts])})")
+
         else:
-            matches = [
-                a for a in self.accounts if a.account_id == kwargs["account_id"]
-            ]
-            if not matches:
-                raise InvalidRequestError(f"Invalid account_id specified (possible values are: {','.join([a.account_id for a in self.accounts])})")
-            return matches[0].account_id
+            return kwargs["account_id"]
 
     def _validate_price_fields(self, order_type, raise_exception=True, **kwargs):
         """
@@ -222,10 +262,10 @@ class OrderPlant(BasePlant):
         msg_kwargs["account_id"] = kwargs.pop("account_id", None)
 
         # Get trade route
-        filtered = [r for r in self.trade_routes if r.exchange == exchange]
-        if len(filtered) == 0:
+        trade_route = self._trade_route_by_exchange.get(exchange)
+        if trade_route is None:
             raise Exception(f"No Valid Trade Route Exists for {exchange}")
-        msg_kwargs["trade_route"] = filtered[0].trade_route
+        msg_kwargs["trade_route"] = trade_route
 
         template_id = 312
         # Stop or target specified: use template_id 330 for bracket orders
@@ -323,6 +363,12 @@ class OrderPlant(BasePlant):
 
         Note: we can't update SL/TP/main order concurrently or Rithmic will send back an error: 'Atomic order operation in progress'
 
+        Stop/target modifications are skipped when `stop_ticks`/`target_ticks` equal the current values,
+        and the main order is only modified if one of its own attributes was passed.
+
+        Returns the ModifyOrder (315) responses, or the stop/target (335/333) responses when only the
+        bracket was modified (empty if `stop_ticks`/`target_ticks` already had the requested values).
+
         For time-critical modifications, pass `order=` with an object containing
         the required fields (account_id, basket_id, symbol, exchange, quantity,
         price_type, price) to skip the get_order() network call.
@@ -334,6 +380,10 @@ class OrderPlant(BasePlant):
         if not order:
             raise Exception(f"Order not found: {kwargs}")
 
+        # A call that only moves the stop/target doesn't need to resend the main order
+        bracket_only = not any(k in kwargs for k in ("qty", "order_type", "price", "trigger_price")) \
+            and ("stop_ticks" in kwargs or "target_ticks" in kwargs)
+
         order_type: OrderType = kwargs.pop("order_type", order.price_type)
         qty: int = kwargs.pop("qty", order.quantity)
 
@@ -342,33 +392,40 @@ class OrderPlant(BasePlant):
         if "stop_ticks" in kwargs or "target_ticks" in kwargs:
             current_stop_ticks, current_target_ticks = await self.get_stop_and_target(basket_id=order.basket_id, account_id=order.account_id)
 
+        bracket_responses = []
+
         # Update the stop
         if "stop_ticks" in kwargs:
             if current_stop_ticks is None:
                 raise InvalidRequestError("Cannot modify stop for order: No stop loss was set at order creation.")
 
-            await self._send_and_collect(
-                template_id=334,
-                expected_response=dict(template_id=335),
-                account_id=order.account_id,
-                basket_id=order.basket_id,
-                level=current_stop_ticks,
-                stop_ticks=kwargs["stop_ticks"],
-            )
+            if kwargs["stop_ticks"] != current_stop_ticks:
+                bracket_responses += await self._send_and_collect(
+                    template_id=334,
+                    expected_response=dict(template_id=335),
+                    account_id=order.account_id,
+                    basket_id=order.basket_id,
+                    level=current_stop_ticks,
+                    stop_ticks=kwargs["stop_ticks"],
+                )
 
         # Update the target
         if "target_ticks" in kwargs:
             if current_target_ticks is None:
                 raise InvalidRequestError("Cannot modify target for order: No target was set at order creation.")
 
-            await self._send_and_collect(
-                template_id=332,
-                expected_response=dict(template_id=333),
-                account_id=order.account_id,
-                basket_id=order.basket_id,
-                level=current_target_ticks,
-                target_ticks=kwargs["target_ticks"],
-            )
+            if kwargs["target_ticks"] != current_target_ticks:
+                bracket_responses += await self._send_and_collect(
+                    template_id=332,
+                    expected_response=dict(template_id=333),
+                    account_id=order.account_id,
+                    basket_id=order.basket_id,
+                    level=current_target_ticks,
+                    target_ticks=kwargs["target_ticks"],
+                )
+
+        if bracket_only:
+            return bracket_responses
 
         # Update the actual order
         msg_kwargs = self._validate_price_fields(order_type, raise_exception=False, **kwargs)
@@ -432,21 +489,9 @@ class OrderPlant(BasePlant):
         if await super()._process_response(response):
             return True
 
-        if response.template_id == 350:
-            # Trade route update
-            await self.client.on_trade_route_update.call_async(response)
-
-        elif response.template_id == 351:
-            # Rithmic order notification
-            await self.client.on_rithmic_order_notification.call_async(response)
-
-        elif response.template_id == 352:
-            # Exchange order notification
-            await self.client.on_exchange_order_notification.call_async(response)
-
-        elif response.template_id == 353:
-            # Bracket update
-            await self.client.on_bracket_update.call_async(response)
-
-        else:
+        event = self._update_events.get(response.template_id)
+        if event is None:
             self.logger.warning(f"Unhandled inbound message with template_id={response.template_id}")
+            return
+
+        await self._dispatch(event, response)
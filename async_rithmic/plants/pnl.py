@@ -2,6 +2,8 @@ from .base import BasePlant
 from ..enums import SysInfraType
 from .. import protocol_buffers as pb
 
+PnlPositionUpdatesRequest = pb.request_pnl_position_updates_pb2.RequestPnLPositionUpdates.Request
+
 class PnlPlant(BasePlant):
     infra_type = SysInfraType.PNL_PLANT
 
@@ -23,7 +25,7 @@ class PnlPlant(BasePlant):
                 fcm_id=self.client.fcm_id,
                 ib_id=self.client.ib_id,
                 account_id=account.account_id,
-                request=pb.request_pnl_position_updates_pb2.RequestPnLPositionUpdates.Request.SUBSCRIBE
+                request=PnlPositionUpdatesRequest.SUBSCRIBE
             )
 
     async def unsubscribe_from_pnl_updates(self):
@@ -38,7 +40,7 @@ class PnlPlant(BasePlant):
                 fcm_id=self.client.fcm_id,
                 ib_id=self.client.ib_id,
                 account_id=account.account_id,
-                request=pb.request_pnl_position_updates_pb2.RequestPnLPositionUpdates.Request.UNSUBSCRIBE
+                request=PnlPositionUpdatesRequest.UNSUBSCRIBE
             )
 
     async def list_positions(self, **kwargs):
@@ -67,11 +69,11 @@ class PnlPlant(BasePlant):
 
         if response.template_id == 450:
             # Instrument PNL position update
-            await self.client.on_instrument_pnl_update.call_async(response)
+            await self._dispatch(self.client.on_instrument_pnl_update, response)
 
         elif response.template_id == 451:
             # Account PNL position update
-            await self.client.on_account_pnl_update.call_async(response)
+            await self._dispatch(self.client.on_account_pnl_update, response)
 
         else:
             self.logger.warning(f"Unhandled inbound message with template_id={response.template_id}")
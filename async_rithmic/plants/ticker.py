@@ -4,6 +4,9 @@ from .base import BasePlant
 from ..enums import SysInfraType, DataType, SearchPattern
 from .. import protocol_buffers as pb
 
+MarketDataRequest = pb.request_market_data_update_pb2.RequestMarketDataUpdate.Request
+DepthByOrderRequest = pb.request_depth_by_order_updates_pb2.RequestDepthByOrderUpdates.Request
+
 class TickerPlant(BasePlant):
     infra_type = SysInfraType.TICKER_PLANT
 
@@ -49,7 +52,7 @@ class TickerPlant(BasePlant):
         exchange: str,
         data_type: DataType | int
     ):
-        update_bits = data_type.value if isinstance(data_type, DataType) else int(data_type)
+        update_bits = int(data_type)
 
         sub = (symbol, exchange, update_bits)
         self._subscriptions["market_data"].add(sub)
@@ -58,7 +61,7 @@ class TickerPlant(BasePlant):
             template_id=100,
             symbol=symbol,
             exchange=exchange,
-            request=pb.request_market_data_update_pb2.RequestMarketDataUpdate.Request.SUBSCRIBE,
+            request=MarketDataRequest.SUBSCRIBE,
             update_bits=update_bits,
         )
 
@@ -68,7 +71,7 @@ class TickerPlant(BasePlant):
         exchange: str,
         data_type: DataType | int
     ):
-        update_bits = data_type.value if isinstance(data_type, DataType) else int(data_type)
+        update_bits = int(data_type)
 
         sub = (symbol, exchange, update_bits)
         self._subscriptions["market_data"].discard(sub)
@@ -77,7 +80,7 @@ class TickerPlant(BasePlant):
             template_id=100,
             symbol=symbol,
             exchange=exchange,
-            request=pb.request_market_data_update_pb2.RequestMarketDataUpdate.Request.UNSUBSCRIBE,
+            request=MarketDataRequest.UNSUBSCRIBE,
             update_bits=update_bits,
         )
 
@@ -138,7 +141,7 @@ class TickerPlant(BasePlant):
             symbol=symbol,
             exchange=exchange,
             depth_price=depth_price,
-            request=pb.request_depth_by_order_updates_pb2.RequestDepthByOrderUpdates.Request.SUBSCRIBE,
+            request=DepthByOrderRequest.SUBSCRIBE,
         )
 
     async def unsubscribe_from_market_depth(
@@ -159,7 +162,7 @@ class TickerPlant(BasePlant):
             symbol=symbol,
             exchange=exchange,
             depth_price=depth_price,
-            request=pb.request_depth_by_order_updates_pb2.RequestDepthByOrderUpdates.Request.UNSUBSCRIBE,
+            request=DepthByOrderRequest.UNSUBSCRIBE,
         )
 
     async def _process_response(self, response):
@@ -180,7 +183,7 @@ class TickerPlant(BasePlant):
             data["datetime"] = self._ssboe_usecs_to_datetime(response.ssboe, response.usecs)
             data["data_type"] = DataType.LAST_TRADE
 
-            await self.client.on_tick.call_async(data)
+            await self._dispatch(self.client.on_tick, data)
 
         elif response.template_id == 151:
             # Market data stream: Best Bid Offer
@@ -188,15 +191,15 @@ class TickerPlant(BasePlant):
             data["datetime"] = self._ssboe_usecs_to_datetime(response.ssboe, response.usecs)
             data["data_type"] = DataType.BBO
 
-            await self.client.on_tick.call_async(data)
+            await self._dispatch(self.client.on_tick, data)
 
         elif response.template_id == 156:
             # Market data stream: Order Book
-            await self.client.on_order_book.call_async(response)
+            await self._dispatch(self.client.on_order_book, response)
 
         elif response.template_id == 160:
             # Market depth data stream
-            await self.client.on_market_depth.call_async(response)
+            await self._dispatch(self.client.on_market_depth, response)
 
         else:
             self.logger.warning(f"Unhandled inbound message with template_id={response.template_id}")
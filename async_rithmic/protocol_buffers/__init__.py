@@ -1,13 +1,190 @@
-import os
-import importlib
+# Generated by scripts/generate_init.py - do not edit by hand.
+# Run `make protoc` to regenerate after adding or removing .proto files.
 
-# Get the directory path of the current file
-package_dir = os.path.dirname(__file__)
+from . import account_pnl_position_update_pb2
+from . import base_pb2
+from . import best_bid_offer_pb2
+from . import bracket_updates_pb2
+from . import depth_by_order_end_event_pb2
+from . import depth_by_order_pb2
+from . import exchange_order_notification_pb2
+from . import forced_logout_pb2
+from . import instrument_pnl_position_update_pb2
+from . import last_trade_pb2
+from . import order_book_pb2
+from . import reject_pb2
+from . import request_account_list_pb2
+from . import request_account_rms_info_pb2
+from . import request_bracket_order_pb2
+from . import request_cancel_all_orders_pb2
+from . import request_cancel_order_pb2
+from . import request_depth_by_order_snapshot_pb2
+from . import request_depth_by_order_updates_pb2
+from . import request_exit_position_pb2
+from . import request_front_month_contract_pb2
+from . import request_heartbeat_pb2
+from . import request_list_exchange_permissions_pb2
+from . import request_login_info_pb2
+from . import request_login_pb2
+from . import request_logout_pb2
+from . import request_market_data_update_pb2
+from . import request_modify_order_pb2
+from . import request_new_order_pb2
+from . import request_pnl_position_snapshot_pb2
+from . import request_pnl_position_updates_pb2
+from . import request_product_rms_info_pb2
+from . import request_reference_data_pb2
+from . import request_rithmic_system_info_pb2
+from . import request_search_symbols_pb2
+from . import request_show_bracket_stops_pb2
+from . import request_show_brackets_pb2
+from . import request_show_order_history_dates_pb2
+from . import request_show_order_history_detail_pb2
+from . import request_show_order_history_summary_pb2
+from . import request_show_orders_pb2
+from . import request_subscribe_for_order_updates_pb2
+from . import request_subscribe_to_bracket_updates_pb2
+from . import request_tick_bar_replay_pb2
+from . import request_tick_bar_update_pb2
+from . import request_time_bar_replay_pb2
+from . import request_time_bar_update_pb2
+from . import request_trade_routes_pb2
+from . import request_update_stop_bracket_level_pb2
+from . import request_update_target_bracket_level_pb2
+from . import response_account_list_pb2
+from . import response_account_rms_info_pb2
+from . import response_bracket_order_pb2
+from . import response_cancel_all_orders_pb2
+from . import response_cancel_order_pb2
+from . import response_depth_by_order_snapshot_pb2
+from . import response_depth_by_order_updates_pb2
+from . import response_exit_position_pb2
+from . import response_front_month_contract_pb2
+from . import response_heartbeat_pb2
+from . import response_list_exchange_permissions_pb2
+from . import response_login_info_pb2
+from . import response_login_pb2
+from . import response_logout_pb2
+from . import response_market_data_update_pb2
+from . import response_modify_order_pb2
+from . import response_new_order_pb2
+from . import response_pnl_position_snapshot_pb2
+from . import response_pnl_position_updates_pb2
+from . import response_product_rms_info_pb2
+from . import response_reference_data_pb2
+from . import response_rithmic_system_info_pb2
+from . import response_search_symbols_pb2
+from . import response_show_bracket_stops_pb2
+from . import response_show_brackets_pb2
+from . import response_show_order_history_dates_pb2
+from . import response_show_order_history_detail_pb2
+from . import response_show_order_history_summary_pb2
+from . import response_show_orders_pb2
+from . import response_subscribe_for_order_updates_pb2
+from . import response_subscribe_to_bracket_updates_pb2
+from . import response_tick_bar_replay_pb2
+from . import response_tick_bar_update_pb2
+from . import response_time_bar_replay_pb2
+from . import response_time_bar_update_pb2
+from . import response_trade_routes_pb2
+from . import response_update_stop_bracket_level_pb2
+from . import response_update_target_bracket_level_pb2
+from . import rithmic_order_notification_pb2
+from . import tick_bar_pb2
+from . import time_bar_pb2
+from . import trade_route_pb2
 
-# Loop through all files in the directory
-for filename in os.listdir(package_dir):
-    # Import any Python files except __init__.py
-    if filename.endswith('.py') and filename != '__init__.py':
-        module_name = filename[:-3]  # Remove the .py extension
-        # Import the module dynamically
-        importlib.import_module(f'.{module_name}', package=__name__)
+__all__ = (
+    "account_pnl_position_update_pb2",
+    "base_pb2",
+    "best_bid_offer_pb2",
+    "bracket_updates_pb2",
+    "depth_by_order_end_event_pb2",
+    "depth_by_order_pb2",
+    "exchange_order_notification_pb2",
+    "forced_logout_pb2",
+    "instrument_pnl_position_update_pb2",
+    "last_trade_pb2",
+    "order_book_pb2",
+    "reject_pb2",
+    "request_account_list_pb2",
+    "request_account_rms_info_pb2",
+    "request_bracket_order_pb2",
+    "request_cancel_all_orders_pb2",
+    "request_cancel_order_pb2",
+    "request_depth_by_order_snapshot_pb2",
+    "request_depth_by_order_updates_pb2",
+    "request_exit_position_pb2",
+    "request_front_month_contract_pb2",
+    "request_heartbeat_pb2",
+    "request_list_exchange_permissions_pb2",
+    "request_login_info_pb2",
+    "request_login_pb2",
+    "request_logout_pb2",
+    "request_market_data_update_pb2",
+    "request_modify_order_pb2",
+    "request_new_order_pb2",
+    "request_pnl_position_snapshot_pb2",
+    "request_pnl_position_updates_pb2",
+    "request_product_rms_info_pb2",
+    "request_reference_data_pb2",
+    "request_rithmic_system_info_pb2",
+    "request_search_symbols_pb2",
+    "request_show_bracket_stops_pb2",
+    "request_show_brackets_pb2",
+    "request_show_order_history_dates_pb2",
+    "request_show_order_history_detail_pb2",
+    "request_show_order_history_summary_pb2",
+    "request_show_orders_pb2",
+    "request_subscribe_for_order_updates_pb2",
+    "request_subscribe_to_bracket_updates_pb2",
+    "request_tick_bar_replay_pb2",
+    "request_tick_bar_update_pb2",
+    "request_time_bar_replay_pb2",
+    "request_time_bar_update_pb2",
+    "request_trade_routes_pb2",
+    "request_update_stop_bracket_level_pb2",
+    "request_update_target_bracket_level_pb2",
+    "response_account_list_pb2",
+    "response_account_rms_info_pb2",
+    "response_bracket_order_pb2",
+    "response_cancel_all_orders_pb2",
+    "response_cancel_order_pb2",
+    "response_depth_by_order_snapshot_pb2",
+    "response_depth_by_order_updates_pb2",
+    "response_exit_position_pb2",
+    "response_front_month_contract_pb2",
+    "response_heartbeat_pb2",
+    "response_list_exchange_permissions_pb2",
+    "response_login_info_pb2",
+    "response_login_pb2",
+    "response_logout_pb2",
+    "response_market_data_update_pb2",
+    "response_modify_order_pb2",
+    "response_new_order_pb2",
+    "response_pnl_position_snapshot_pb2",
+    "response_pnl_position_updates_pb2",
+    "response_product_rms_info_pb2",
+    "response_reference_data_pb2",
+    "response_rithmic_system_info_pb2",
+    "response_search_symbols_pb2",
+    "response_show_bracket_stops_pb2",
+    "response_show_brackets_pb2",
+    "response_show_order_history_dates_pb2",
+    "response_show_order_history_detail_pb2",
+    "response_show_order_history_summary_pb2",
+    "response_show_orders_pb2",
+    "response_subscribe_for_order_updates_pb2",
+    "response_subscribe_to_bracket_updates_pb2",
+    "response_tick_bar_replay_pb2",
+    "response_tick_bar_update_pb2",
+    "response_time_bar_replay_pb2",
+    "response_time_bar_update_pb2",
+    "response_trade_routes_pb2",
+    "response_update_stop_bracket_level_pb2",
+    "response_update_target_bracket_level_pb2",
+    "rithmic_order_notification_pb2",
+    "tick_bar_pb2",
+    "time_bar_pb2",
+    "trade_route_pb2",
+)
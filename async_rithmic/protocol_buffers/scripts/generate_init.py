@@ -0,0 +1,29 @@
+import os
+
+# Regenerates protocol_buffers/__init__.py with a static list of the *_pb2 modules,
+# so the package does not have to scan its own directory on every interpreter start.
+
+package_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+with os.scandir(package_dir) as entries:
+    module_names = sorted(
+        entry.name[:-3]
+        for entry in entries
+        if entry.name.endswith('_pb2.py') and entry.is_file(follow_symlinks=False)
+    )
+
+lines = [
+    '# Generated by scripts/generate_init.py - do not edit by hand.\n',
+    '# Run `make protoc` to regenerate after adding or removing .proto files.\n',
+    '\n',
+]
+lines.extend(f'from . import {name}\n' for name in module_names)
+lines.append('\n')
+lines.append('__all__ = (\n')
+lines.extend(f'    "{name}",\n' for name in module_names)
+lines.append(')\n')
+
+with open(os.path.join(package_dir, '__init__.py'), 'w') as file:
+    file.writelines(lines)
+
+print(f'Generated __init__.py with {len(module_names)} modules')
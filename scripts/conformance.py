@@ -1,17 +1,18 @@
 import asyncio
 import logging
+import os
 from async_rithmic import RithmicClient
 
 logging.getLogger("rithmic").setLevel(logging.DEBUG)
 
 async def main():
     client = RithmicClient(
-        user="your_username",
-        password="your_password",
+        user=os.environ.get("RITHMIC_USER", "your_username"),
+        password=os.environ.get("RITHMIC_PASSWORD", "your_password"),
         system_name="Rithmic Test",
-        app_name="your_test_app",
+        app_name=os.environ.get("RITHMIC_APP_NAME", "your_test_app"),
         app_version="1.0",
-        url="rituz00100.rithmic.com:443"  # Test gateway
+        url=os.environ.get("RITHMIC_URL", "rituz00100.rithmic.com:443")  # Test gateway
     )
 
     # Only need to login to the order plant of Rithmic Test, and leave the app logged in.
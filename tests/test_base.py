@@ -1,9 +1,12 @@
-from unittest.mock import MagicMock
+import logging
+from unittest.mock import MagicMock, AsyncMock, patch
 from datetime import datetime
+from pathlib import Path
 import pytz
 import pytest
 
 from async_rithmic.plants import TickerPlant
+from async_rithmic import DataType, _warn_if_pure_python_protobuf
 from async_rithmic import protocol_buffers as pb
 
 from conftest import load_response_mock_from_filename
@@ -59,3 +62,51 @@ def test_ssboe_usecs_conversion(ssboe, usecs, expected_dt):
     output = plant._datetime_to_ssboe_usecs(dt)
     assert output == (int(ssboe), int(usecs))
 
+def test_datatype_from_bit():
+    assert DataType.from_bit(1) is DataType.LAST_TRADE
+    assert DataType.from_bit(3) is None
+    assert DataType.from_bit(99) is None
+
+def test_protocol_buffers_index_is_up_to_date():
+    # protocol_buffers/__init__.py is generated: make sure it was regenerated after the last `make protoc`
+    package_dir = Path(pb.__file__).parent
+    on_disk = sorted(p.stem for p in package_dir.glob("*_pb2.py"))
+
+    assert list(pb.__all__) == on_disk
+
+@pytest.mark.parametrize("implementation, warns", [("python", True), ("upb", False)])
+def test_warns_when_protobuf_uses_pure_python_backend(caplog, implementation, warns):
+    with patch("google.protobuf.internal.api_implementation.Type", return_value=implementation):
+        with caplog.at_level(logging.WARNING, logger="rithmic"):
+            _warn_if_pure_python_protobuf()
+
+    assert any("pure-Python implementation" in r.getMessage() for r in caplog.records) == warns
+
+
+async def test_messages_are_not_formatted_when_debug_logging_is_off():
+    api = TickerPlant(MagicMock())
+    api._send = AsyncMock()
+    api.logger.setLevel(logging.INFO)
+
+    with patch("async_rithmic.plants.base.MessageToDict") as message_to_dict:
+        await api._send_request(template_id=18)
+        message_to_dict.assert_not_called()
+
+        api.logger.setLevel(logging.DEBUG)
+        await api._send_request(template_id=18)
+        message_to_dict.assert_called_once()
+
+    api.logger.setLevel(logging.NOTSET)
+
+
+def test_build_request_sets_login_info_fields():
+    api = TickerPlant(MagicMock(fcm_id="fcm", ib_id="ib", user_type=3))
+
+    rq = api._build_request(template_id=302)
+    assert (rq.fcm_id, rq.ib_id, rq.user_type) == ("fcm", "ib", 3)
+
+    rq = api._build_request(template_id=312, symbol="ESZ4")
+    assert (rq.fcm_id, rq.ib_id) == ("fcm", "ib")
+
+    rq = api._build_request(template_id=18)
+    assert not hasattr(rq, "fcm_id")
@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from websockets.exceptions import ConnectionClosedError
 from async_rithmic.helpers.connectivity import DisconnectionHandler, try_to_reconnect
 from async_rithmic import ReconnectionSettings
+from async_rithmic.exceptions import ReconnectionError
 
 class FakePlant:
     def __init__(self):
@@ -27,6 +28,7 @@ class FakePlant:
         self._reconnect_lock = asyncio.Lock()
         self._reconnect_event = asyncio.Event()
         self._reconnect_event.set()
+        self._connection_lost = False
 
 @pytest.mark.parametrize("fail_on_attempt", [1, 3, 5])
 async def test_disconnection_handler_retries_and_succeeds(fail_on_attempt):
@@ -192,3 +194,43 @@ async def test_only_one_reconnect():
     # Assert reconnect was only attempted once
     assert reconnect_mock.call_count == 1
 
+async def test_recv_loop_stops_when_reconnection_gives_up(ticker_plant_mock):
+    plant = ticker_plant_mock
+    plant.client.on_disconnected.call_async = AsyncMock()
+    plant._recv = AsyncMock(side_effect=ConnectionClosedError(rcvd=None, sent=None))
+
+    with patch("async_rithmic.helpers.connectivity.try_to_reconnect", new=AsyncMock(return_value=False)):
+        # Must return on its own instead of spinning on the dead socket
+        await asyncio.wait_for(plant._recv_loop(), timeout=1)
+
+    assert plant._recv.call_count == 1
+
+async def test_heartbeat_cannot_revive_plant_after_reconnection_gives_up(ticker_plant_mock):
+    plant = ticker_plant_mock
+    plant.client.on_disconnected.call_async = AsyncMock()
+    plant.client.reconnection_settings = ReconnectionSettings(backoff_type="constant", interval=0.01, max_retries=1)
+    plant.heartbeat_interval = 1.05
+    plant._recv = AsyncMock(side_effect=ConnectionClosedError(rcvd=None, sent=None))
+    plant._connect = AsyncMock(side_effect=Exception("fail_connect"))
+    plant._login = AsyncMock()
+
+    await plant._start_background_tasks()
+    recv_task, process_task, heartbeat_task = plant._bg_tasks
+
+    await asyncio.wait_for(recv_task, timeout=1)
+    await asyncio.sleep(0)
+
+    # The whole plant is stopped and listeners are told about it
+    assert process_task.done() and heartbeat_task.done()
+    plant.client.on_disconnected.call_async.assert_awaited_once_with("ticker")
+
+    # A later send on the dead socket raises instead of starting a new reconnection round
+    plant._connect.reset_mock()
+    plant.ws.send = AsyncMock(side_effect=ConnectionClosedError(rcvd=None, sent=None))
+    with pytest.raises(ReconnectionError):
+        await plant._send(b"heartbeat")
+
+    plant._connect.assert_not_called()
+    plant._login.assert_not_called()
+
+    await plant._stop_background_tasks()
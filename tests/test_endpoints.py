@@ -1,7 +1,15 @@
+import pytest
 import asyncio
-from unittest.mock import patch, MagicMock
+from datetime import datetime
+import pytz
+from unittest.mock import patch, MagicMock, AsyncMock
 from contextlib import suppress
+from pattern_kit import Event
 
+from async_rithmic import DataType, OrderType, TransactionType, TimeBarType
+from async_rithmic.exceptions import RithmicErrorResponse, InvalidRequestError
+from async_rithmic import protocol_buffers as pb
+from async_rithmic.plants import OrderPlant, HistoryPlant, TickerPlant
 from conftest import load_response_mock_from_filename
 
 async def test_get_front_month_contract(ticker_plant_mock):
@@ -33,3 +41,199 @@ async def test_get_front_month_contract(ticker_plant_mock):
         with suppress(asyncio.CancelledError):
             await task
 
+async def test_subscribe_to_market_data_with_combined_data_types(ticker_plant_mock):
+    ticker_plant_mock._send_request = AsyncMock()
+
+    await ticker_plant_mock.subscribe_to_market_data("ESZ4", "CME", DataType.LAST_TRADE | DataType.BBO)
+
+    assert ticker_plant_mock._send_request.call_args.kwargs["update_bits"] == 3
+    assert ("ESZ4", "CME", 3) in ticker_plant_mock._subscriptions["market_data"]
+
+async def test_order_updates_are_dispatched_to_client_events():
+    client = MagicMock()
+    client.on_exchange_order_notification.call_async = AsyncMock()
+    client.on_rithmic_order_notification.call_async = AsyncMock()
+    plant = OrderPlant(client)
+
+    response = pb.exchange_order_notification_pb2.ExchangeOrderNotification(template_id=352)
+    await plant._process_response(response)
+
+    client.on_exchange_order_notification.call_async.assert_awaited_once_with(response)
+    client.on_rithmic_order_notification.call_async.assert_not_awaited()
+
+async def test_submit_order_uses_first_trade_route_of_exchange(order_plant_mock):
+    plant = order_plant_mock
+    plant._send_and_recv_immediate = AsyncMock(return_value=[MagicMock(fcm_id="fcm", ib_id="ib", user_type=3)])
+    plant._list_trade_routes = AsyncMock(return_value=[
+        MagicMock(exchange="CME", trade_route="route_1"),
+        MagicMock(exchange="CME", trade_route="route_2"),
+        MagicMock(exchange="CBOT", trade_route="route_3"),
+    ])
+    plant.list_accounts = AsyncMock(return_value=[MagicMock(account_id="acct1")])
+    await plant._fetch_login_info()
+
+    plant._send_and_collect = AsyncMock()
+    await plant.submit_order("order_1", "ESZ4", "CME", 1, TransactionType.BUY, OrderType.MARKET)
+    assert plant._send_and_collect.call_args.kwargs["trade_route"] == "route_1"
+
+    with pytest.raises(Exception, match="No Valid Trade Route Exists for NYMEX"):
+        await plant.submit_order("order_2", "CLZ4", "NYMEX", 1, TransactionType.BUY, OrderType.MARKET)
+
+async def test_get_order_queries_all_accounts_concurrently(order_plant_mock):
+    plant = order_plant_mock
+    plant.accounts = [MagicMock(account_id="acct1"), MagicMock(account_id="acct2")]
+
+    orders = {
+        "acct1": [MagicMock(user_tag="other", basket_id="1")],
+        "acct2": [MagicMock(user_tag="order_1", basket_id="2")],
+    }
+    started = []
+
+    async def list_orders(account_id):
+        started.append(account_id)
+        await asyncio.sleep(0)
+        # Both requests must be in flight before either one completes
+        assert len(started) == 2
+        return orders[account_id]
+
+    plant.list_orders = list_orders
+
+    order = await plant.get_order(order_id="order_1")
+    assert order.basket_id == "2"
+
+    started.clear()
+    assert await plant.get_order(basket_id="3") is None
+
+async def test_get_order_tolerates_failing_accounts(order_plant_mock):
+    plant = order_plant_mock
+    plant.accounts = [MagicMock(account_id="acct1"), MagicMock(account_id="acct2")]
+
+    async def list_orders(account_id):
+        if account_id == "acct1":
+            raise RithmicErrorResponse("error")
+        return [MagicMock(user_tag="order_1", basket_id="2")]
+
+    plant.list_orders = list_orders
+
+    order = await plant.get_order(order_id="order_1")
+    assert order.basket_id == "2"
+
+    # Accounts assigned directly are used to validate account ids
+    assert plant._get_account_id(account_id="acct2") == "acct2"
+    with pytest.raises(InvalidRequestError, match="Invalid account_id"):
+        plant._get_account_id(account_id="acct3")
+
+    # If no other account has the order, the failure is surfaced
+    with pytest.raises(RithmicErrorResponse):
+        await plant.get_order(order_id="order_2")
+
+async def test_modify_order_skips_unchanged_stop_and_target(order_plant_mock):
+    plant = order_plant_mock
+    order = MagicMock(account_id="acct1", basket_id="1", symbol="ESZ4", exchange="CME", quantity=1, price_type=OrderType.LIMIT, price=5000.0)
+    plant.get_stop_and_target = AsyncMock(return_value=(10, 20))
+    plant._send_and_collect = AsyncMock(side_effect=lambda **kwargs: [MagicMock(template_id=kwargs["template_id"] + 1)])
+
+    responses = await plant.modify_order(order=order, stop_ticks=10, target_ticks=25)
+
+    template_ids = [c.kwargs["template_id"] for c in plant._send_and_collect.call_args_list]
+    assert template_ids == [332]
+    assert [r.template_id for r in responses] == [333]
+
+    plant._send_and_collect.reset_mock()
+    await plant.modify_order(order=order, stop_ticks=15, price=5001.0)
+
+    template_ids = [c.kwargs["template_id"] for c in plant._send_and_collect.call_args_list]
+    assert template_ids == [334, 314]
+
+async def test_historical_ticks_are_only_buffered_for_waiting_requests():
+    plant = HistoryPlant(MagicMock())
+    plant._send_and_recv_immediate = AsyncMock()
+
+    # Nobody is waiting: the tick is only dispatched to the client event, not retained
+    await plant._on_historical_tick({"symbol": "ESZ4"})
+    assert plant.historical_tick_data == {}
+
+    task = asyncio.create_task(plant.get_historical_tick_data(
+        "ESZ4", "CME",
+        datetime(2024, 11, 8, 14, 0, tzinfo=pytz.utc),
+        datetime(2024, 11, 8, 15, 0, tzinfo=pytz.utc),
+    ))
+    await asyncio.sleep(0.01)
+
+    await plant._on_historical_tick({"symbol": "ESZ4"})
+    plant.historical_tick_event.set()
+
+    assert await task == [{"symbol": "ESZ4"}]
+    assert plant.historical_tick_data == {}
+
+async def test_historical_buffers_are_released_when_the_request_fails():
+    plant = HistoryPlant(MagicMock())
+    plant._send_and_recv_immediate = AsyncMock(side_effect=RithmicErrorResponse("error"))
+    start, end = datetime(2024, 11, 8, 14, 0, tzinfo=pytz.utc), datetime(2024, 11, 8, 15, 0, tzinfo=pytz.utc)
+
+    with pytest.raises(RithmicErrorResponse):
+        await plant.get_historical_tick_data("ESZ4", "CME", start, end)
+    with pytest.raises(RithmicErrorResponse):
+        await plant.get_historical_time_bars("ESZ4", "CME", start, end, TimeBarType.MINUTE_BAR, 1)
+
+    assert plant.historical_tick_data == {}
+    assert plant.historical_time_bar_data == {}
+
+    # Later rows for the same symbol are not retained
+    await plant._on_historical_tick({"symbol": "ESZ4"})
+    await plant._on_historical_time_bar({"symbol": "ESZ4", "type": TimeBarType.MINUTE_BAR})
+    assert plant.historical_tick_data == {}
+    assert plant.historical_time_bar_data == {}
+
+async def test_task_callback_mode_does_not_block_processing():
+    release = asyncio.Event()
+
+    async def slow_listener(response):
+        await release.wait()
+
+    client = MagicMock()
+    client.on_order_book = Event()
+    client.on_order_book += slow_listener
+    plant = TickerPlant(client, callback_mode="task")
+
+    response = pb.order_book_pb2.OrderBook(template_id=156)
+    await asyncio.wait_for(plant._process_response(response), timeout=1)
+    assert len(plant._callback_tasks) == 1
+
+    release.set()
+    await asyncio.sleep(0.01)
+    assert len(plant._callback_tasks) == 0
+
+async def test_stopping_background_tasks_cancels_pending_listener_tasks():
+    async def slow_listener(response):
+        await asyncio.sleep(10)
+
+    client = MagicMock()
+    client.on_order_book = Event()
+    client.on_order_book += slow_listener
+    plant = TickerPlant(client, callback_mode="task")
+
+    await plant._process_response(pb.order_book_pb2.OrderBook(template_id=156))
+    task, = plant._callback_tasks
+
+    await asyncio.wait_for(plant._stop_background_tasks(), timeout=1)
+
+    assert task.cancelled()
+    assert len(plant._callback_tasks) == 0
+
+async def test_task_callback_mode_logs_listener_exceptions():
+    async def failing_listener(response):
+        raise ValueError("listener failed")
+
+    client = MagicMock()
+    client.on_order_book = Event()
+    client.on_order_book += failing_listener
+    plant = TickerPlant(client, callback_mode="task")
+
+    with patch.object(plant, "logger") as logger_mock:
+        await plant._process_response(pb.order_book_pb2.OrderBook(template_id=156))
+        await asyncio.sleep(0.01)
+
+    logger_mock.error.assert_called_once()
+    assert isinstance(logger_mock.error.call_args.kwargs["exc_info"], ValueError)
+    assert len(plant._callback_tasks) == 0
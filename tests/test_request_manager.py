@@ -85,3 +85,16 @@ class TestRequestManager:
                     f"[Request {i}] Response had wrong template_id: {r.template_id} ≠ {expected_template_id}"
                 assert r.account_id == account_id, \
                     f"[Request {i}] Response had wrong account_id: {r.account_id} ≠ {account_id}"
+
+    async def test_responses_only_match_requests_for_their_template(self, manager):
+        manager.start("req1", {}, {"template_id": 301, "account_id": "acct1"})
+        manager.start("req2", {}, {"template_id": 352, "account_id": "acct1"})
+
+        assert manager.handle_response(FakeResponse(352, "acct1"))
+        assert not manager.handle_response(FakeResponse(999, "acct1"))
+        assert manager.responses["req1"] == []
+        assert manager.responses["req2"] == [FakeResponse(352, "acct1")]
+
+        manager.mark_complete("req1")
+        manager.mark_complete("req2")
+        assert not manager.expected_by_template